@@ -1,7 +1,8 @@
 import os
 import json
 import logging
-from typing import Dict, Any
+import orjson
+from typing import Dict, Any, Optional
 from fastapi import APIRouter, HTTPException, status
 import httpx
 from dotenv import load_dotenv
@@ -18,8 +19,6 @@ from ..dto.converting import (
 # 환경변수 로드
 load_dotenv()
 
-# 로깅 설정
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
@@ -31,6 +30,32 @@ OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 if not OPENROUTER_API_KEY:
   logger.warning("OPENROUTER_API_KEY 환경변수가 설정되지 않았습니다.")
 
+# LLM 응답 검증용 Enum 값 집합 (요청마다 Enum을 순회하지 않도록 모듈 로드 시 한 번만 생성)
+VALID_DAYS_OF_WEEK = frozenset(day.value for day in DayOfWeek)
+VALID_CONDITIONS = frozenset(condition.value for condition in Disease)
+VALID_GENDERS = frozenset(gender.value for gender in PreferredGender)
+VALID_SERVICE_TYPES = frozenset(service_type.value for service_type in ServiceType)
+
+# 요청 간 재사용하는 OpenRouter HTTP 클라이언트 (첫 호출 시 생성)
+_http_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+  """keep-alive 연결을 재사용하는 공유 HTTP 클라이언트 반환"""
+  global _http_client
+  if _http_client is None or _http_client.is_closed:
+    _http_client = httpx.AsyncClient(
+      timeout=30.0,
+      limits=httpx.Limits(max_keepalive_connections=64)
+    )
+  return _http_client
+
+async def close_http_client():
+  """공유 HTTP 클라이언트 종료"""
+  global _http_client
+  if _http_client is not None:
+    await _http_client.aclose()
+  _http_client = None
+
 @router.post("/convert", response_model=ConvertNonStructuredDataToStructuredDataResponse)
 async def convert_non_structured_data_to_structured_data(
   request: ConvertNonStructuredDataToStructuredDataRequest
@@ -169,64 +194,64 @@ async def call_openrouter_api(prompt: str) -> Dict[str, Any]:
     "max_tokens": 1000
   }
     
-  async with httpx.AsyncClient(timeout=30.0) as client:
-    try:
-      response = await client.post(
-          f"{OPENROUTER_BASE_URL}/chat/completions",
-          headers=headers,
-          json=payload
-      )
-        
-      if response.status_code != 200:
-          error_detail = response.text
-          logger.error(f"OpenRouter API 오류: {response.status_code} - {error_detail}")
-          raise HTTPException(
-              status_code=status.HTTP_502_BAD_GATEWAY,
-              detail=f"OpenRouter API 호출 실패: {response.status_code}"
-          )
-        
-      result = response.json()
-        
-      if "choices" not in result or not result["choices"]:
-          raise HTTPException(
-              status_code=status.HTTP_502_BAD_GATEWAY,
-              detail="OpenRouter API 응답에 choices가 없습니다."
-          )
-        
-      content = result["choices"][0]["message"]["content"]
-        
-        # JSON 파싱
-      try:
-        # 마크다운 코드블록 제거
-        content = content.strip()
-        if content.startswith('```json'):
-          content = content[7:]  # ```json 제거
-        if content.startswith('```'):
-          content = content[3:]   # ``` 제거
-        if content.endswith('```'):
-          content = content[:-3]  # ``` 제거
-        content = content.strip()
-        
-        parsed_json = json.loads(content)
-        return parsed_json
-      except json.JSONDecodeError as e:
-        logger.error(f"LLM 응답 JSON 파싱 오류: {content}")
+  client = get_http_client()
+  try:
+    response = await client.post(
+        f"{OPENROUTER_BASE_URL}/chat/completions",
+        headers=headers,
+        json=payload
+    )
+      
+    if response.status_code != 200:
+        error_detail = response.text
+        logger.error(f"OpenRouter API 오류: {response.status_code} - {error_detail}")
         raise HTTPException(
-          status_code=status.HTTP_502_BAD_GATEWAY,
-          detail="LLM 응답을 JSON으로 파싱할 수 없습니다."
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"OpenRouter API 호출 실패: {response.status_code}"
         )
-            
-      except httpx.TimeoutException:
+      
+    result = orjson.loads(response.content)
+      
+    if "choices" not in result or not result["choices"]:
         raise HTTPException(
-          status_code=status.HTTP_504_GATEWAY_TIMEOUT,
-          detail="OpenRouter API 호출 시간 초과"
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="OpenRouter API 응답에 choices가 없습니다."
         )
-    except httpx.RequestError as e:
-      logger.error(f"OpenRouter API 요청 오류: {str(e)}")
+      
+    content = result["choices"][0]["message"]["content"]
+      
+      # JSON 파싱
+    try:
+      # 마크다운 코드블록 제거
+      content = content.strip()
+      if content.startswith('```json'):
+        content = content[7:]  # ```json 제거
+      if content.startswith('```'):
+        content = content[3:]   # ``` 제거
+      if content.endswith('```'):
+        content = content[:-3]  # ``` 제거
+      content = content.strip()
+      
+      parsed_json = orjson.loads(content)
+      return parsed_json
+    except json.JSONDecodeError as e:
+      logger.error(f"LLM 응답 JSON 파싱 오류: {content}")
       raise HTTPException(
         status_code=status.HTTP_502_BAD_GATEWAY,
-        detail="OpenRouter API 연결 오류"
+        detail="LLM 응답을 JSON으로 파싱할 수 없습니다."
+      )
+          
+    except httpx.TimeoutException:
+      raise HTTPException(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        detail="OpenRouter API 호출 시간 초과"
       )
+  except httpx.RequestError as e:
+    logger.error(f"OpenRouter API 요청 오류: {str(e)}")
+    raise HTTPException(
+      status_code=status.HTTP_502_BAD_GATEWAY,
+      detail="OpenRouter API 연결 오류"
+    )
 
 def parse_llm_response(llm_data: Dict[str, Any]) -> ConvertNonStructuredDataToStructuredDataResponse:
     """LLM 응답을 DTO로 변환"""
@@ -235,27 +260,23 @@ def parse_llm_response(llm_data: Dict[str, Any]) -> ConvertNonStructuredDataToSt
       # 요일 검증 및 변환
       day_of_week = []
       if "day_of_week" in llm_data and llm_data["day_of_week"]:
-        valid_days = [day.value for day in DayOfWeek]
-        day_of_week = [day for day in llm_data["day_of_week"] if day in valid_days]
+        day_of_week = [day for day in llm_data["day_of_week"] if day in VALID_DAYS_OF_WEEK]
       
       # 지원 질환 검증 및 변환
       supported_conditions = []
       if "supported_conditions" in llm_data and llm_data["supported_conditions"]:
-        valid_conditions = [condition.value for condition in Disease]
-        supported_conditions = [condition for condition in llm_data["supported_conditions"] if condition in valid_conditions]
+        supported_conditions = [condition for condition in llm_data["supported_conditions"] if condition in VALID_CONDITIONS]
       
       # 선호 성별 검증
       preferred_gender = None
       if "preferred_gender" in llm_data and llm_data["preferred_gender"]:
-        valid_genders = [gender.value for gender in PreferredGender]
-        if llm_data["preferred_gender"] in valid_genders:
+        if llm_data["preferred_gender"] in VALID_GENDERS:
           preferred_gender = llm_data["preferred_gender"]
       
       # 서비스 유형 검증 및 변환
       service_types = []
       if "service_types" in llm_data and llm_data["service_types"]:
-        valid_service_types = [service_type.value for service_type in ServiceType]
-        service_types = [service_type for service_type in llm_data["service_types"] if service_type in valid_service_types]
+        service_types = [service_type for service_type in llm_data["service_types"] if service_type in VALID_SERVICE_TYPES]
       
       # 응답 DTO 생성
       response = ConvertNonStructuredDataToStructuredDataResponse(
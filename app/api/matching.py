@@ -11,40 +11,64 @@
 """
 
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from typing import List, Tuple, Dict, Any, Optional
 import logging
 import asyncio
-from datetime import datetime
+import heapq
+import time
+
+import numpy as np
 
 # 스키마 import
-from ..dto.matching import MatchingRequestDTO, MatchingResponseDTO, MatchedCaregiverDTO, CaregiverForMatchingDTO
+from ..dto.matching import MatchingRequestDTO, MatchingResponseDTO, MatchedCaregiverDTO, CaregiverForMatchingDTO, ServiceRequestDTO
 from ..dto.converting import ConvertNonStructuredDataToStructuredDataRequest
 from ..api.converting import convert_non_structured_data_to_structured_data
-from ..utils.naver_direction import ETACalculator
-from ..utils.time_utils import filter_caregivers_by_time_preference
+from ..utils.naver_direction import ETACalculator, ETABatcher
+from ..utils.time_utils import time_to_minutes, minutes_overlap_mask
+from ..utils.location_calculator import find_within_radius, parse_lat_lon
 
 # ORM 및 데이터베이스 import
 from ..database import get_db_session
 from ..repositories.caregiver_repository import get_all_caregivers
 
-async def get_all_caregivers_from_db() -> List[CaregiverForMatchingDTO]:
+# 진행 중인 요양보호사 조회 (서비스 요청 위치 -> 조회 Task)
+_inflight_caregiver_loads: Dict[Optional[Tuple[float, float]], "asyncio.Task[List[CaregiverForMatchingDTO]]"] = {}
+
+async def get_all_caregivers_from_db(
+    service_location: Optional[Tuple[float, float]] = None
+) -> List[CaregiverForMatchingDTO]:
     """
     데이터베이스에서 모든 요양보호사 목록을 조회하는 함수
-    SQLAlchemy ORM을 사용하여 실제 데이터베이스에서 조회
+    같은 위치에 대한 조회가 이미 진행 중이면 새로 쿼리하지 않고 그 결과를 함께 사용
+    (반환된 목록과 DTO는 요청 간에 공유되므로 수정하지 않음)
+    """
+    task = _inflight_caregiver_loads.get(service_location)
+    if task is None:
+        task = asyncio.ensure_future(load_caregivers_from_db(service_location))
+        _inflight_caregiver_loads[service_location] = task
+        task.add_done_callback(lambda _: _inflight_caregiver_loads.pop(service_location, None))
+    # 한 요청이 취소되어도 같은 조회를 기다리는 다른 요청에는 영향이 없도록 보호
+    return await asyncio.shield(task)
+
+async def load_caregivers_from_db(
+    service_location: Optional[Tuple[float, float]] = None
+) -> List[CaregiverForMatchingDTO]:
+    """
+    SQLAlchemy ORM을 사용하여 실제 데이터베이스에서 요양보호사 목록 조회
+    service_location이 주어지면 반경 15km 경계 상자 안의 요양보호사만 조회
     """
     try:
         # 데이터베이스 세션 의존성 주입
         async for session in get_db_session():
-            # ORM을 사용하여 모든 요양보호사 조회 (이미 완전한 DTO로 변환됨)
-            caregivers = await get_all_caregivers(session)
+            # ORM을 사용하여 요양보호사 조회 (이미 완전한 DTO로 변환됨)
+            caregivers = await get_all_caregivers(session, center=service_location, radius_km=15.0)
             return caregivers
     except Exception as e:
         logger.error(f"데이터베이스에서 요양보호사 조회 중 오류: {str(e)}")
-        # 오류 발생 시 빈 리스트 반환 (기존 동작 유지)
-        return []
+        # 조회 실패는 빈 결과(반경 내 요양보호사 없음)와 구분하여 db_loading 실패로 보고
+        raise MatchingProcessError("db_loading", "데이터베이스 조회 중 오류가 발생했습니다", {"error": str(e)})
 
-# 로깅 설정
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
@@ -52,6 +76,9 @@ router = APIRouter()
 # ETA Calculator 인스턴스 생성
 eta_calculator = ETACalculator()
 
+# 동시 요청의 ETA 계산을 묶어서 처리하는 배처 (워커는 앱 시작 시 구동)
+eta_batcher = ETABatcher(eta_calculator)
+
 class MatchingProcessError(Exception):
     """매칭 프로세스 오류"""
     def __init__(self, step: str, message: str, details: Dict[str, Any] = None):
@@ -60,7 +87,7 @@ class MatchingProcessError(Exception):
         self.details = details or {}
         super().__init__(f"{step}: {message}")
 
-@router.post("/recommend", response_model=MatchingResponseDTO)
+@router.post("/recommend", response_model=MatchingResponseDTO, response_class=ORJSONResponse)
 async def recommend_matching(request: MatchingRequestDTO):
     """
     위치 기반 요양보호사 매칭 처리 API
@@ -68,26 +95,29 @@ async def recommend_matching(request: MatchingRequestDTO):
     processing_results = {}
     
     try:
-        logger.info(f"매칭 요청 시작 - 서비스 요청 ID: {request.serviceRequest.serviceRequestId}")
-        start_time = datetime.now()
+        logger.info("매칭 요청 시작 - 서비스 요청 ID: %s", request.serviceRequest.serviceRequestId)
+        start_time = time.perf_counter()
         
         # 1. 서비스 요청 위치 DTO 수신 검증
         service_location = await validate_service_request(request)
         processing_results["request_validation"] = {"status": "success", "location": f"({service_location[0]}, {service_location[1]})"}
         logger.info("요청 검증 완료")
         
-        # 2. 데이터베이스에서 모든 요양보호사 목록 조회
-        all_caregivers = await get_all_caregivers_from_db()
+        # 2. 데이터베이스에서 서비스 요청 위치 주변(반경 15km 경계 상자) 요양보호사 목록 조회
+        all_caregivers = await get_all_caregivers_from_db(service_location)
         processing_results["db_loading"] = {"status": "success", "count": len(all_caregivers)}
-        logger.info(f"데이터베이스에서 요양보호사 조회 완료: {len(all_caregivers)}명")
+        logger.info("데이터베이스에서 요양보호사 조회 완료: %d명", len(all_caregivers))
         
+        # 조회는 성공했지만 경계 상자 안에 요양보호사가 없으면 반경 필터링 실패로 보고
+        # (조회 오류는 load_caregivers_from_db에서 db_loading 실패로 발생)
         if not all_caregivers:
-            raise MatchingProcessError("db_loading", "데이터베이스에 요양보호사가 없습니다")
+            raise MatchingProcessError("radius_filtering", "15km 반경 내 요양보호사가 없습니다",
+                                     {"radius_km": 15, "request_location": f"({service_location[0]}, {service_location[1]})"})
         
         # 3. 선호시간대 필터링 (요청 검증 후, 반경 필터링 전)
         time_filtered_candidates = await filter_by_time_preferences(all_caregivers, request.serviceRequest)
         processing_results["time_preference_filtering"] = {"status": "success", "count": len(time_filtered_candidates)}
-        logger.info(f"선호시간대 필터링 완료: {len(time_filtered_candidates)}명")
+        logger.info("선호시간대 필터링 완료: %d명", len(time_filtered_candidates))
         
         if not time_filtered_candidates:
             raise MatchingProcessError("time_preference_filtering", "선호시간대에 맞는 요양보호사가 없습니다",
@@ -97,7 +127,7 @@ async def recommend_matching(request: MatchingRequestDTO):
         # 4. 반경 15km 내 요양보호사 근거리 후보군 로드
         nearby_candidates = await load_nearby_caregivers(service_location, time_filtered_candidates)
         processing_results["radius_filtering"] = {"status": "success", "count": len(nearby_candidates)}
-        logger.info(f"반경 필터링 완료: {len(nearby_candidates)}명")
+        logger.info("반경 필터링 완료: %d명", len(nearby_candidates))
         
         if not nearby_candidates:
             raise MatchingProcessError("radius_filtering", "15km 반경 내 요양보호사가 없습니다",
@@ -106,7 +136,7 @@ async def recommend_matching(request: MatchingRequestDTO):
         # 5. LLM 선호조건 변환 및 필터링으로 조건부합 후보군 생성
         qualified_candidates = await filter_by_preferences(nearby_candidates, request)
         processing_results["preference_filtering"] = {"status": "success", "count": len(qualified_candidates)}
-        logger.info(f"선호조건 필터링 완료: {len(qualified_candidates)}명")
+        logger.info("선호조건 필터링 완료: %d명", len(qualified_candidates))
         
         if not qualified_candidates:
             raise MatchingProcessError("preference_filtering", "선호조건에 맞는 요양보호사가 없습니다",
@@ -115,7 +145,7 @@ async def recommend_matching(request: MatchingRequestDTO):
         # 6. 각 사용자 위치 간 예상 소요 시간 계산
         eta_calculated_candidates = await calculate_travel_times(qualified_candidates, service_location)
         processing_results["eta_calculation"] = {"status": "success", "count": len(eta_calculated_candidates)}
-        logger.info(f"ETA 계산 완료: {len(eta_calculated_candidates)}명")
+        logger.info("ETA 계산 완료: %d명", len(eta_calculated_candidates))
         
         if not eta_calculated_candidates:
             raise MatchingProcessError("eta_calculation", "ETA 계산에 실패했습니다",
@@ -124,7 +154,7 @@ async def recommend_matching(request: MatchingRequestDTO):
         # 7. ETA 기준 정렬 후 최종 5명 선정
         final_matches = await select_final_candidates(eta_calculated_candidates)
         processing_results["final_selection"] = {"status": "success", "count": len(final_matches)}
-        logger.info(f"최종 선정 완료: {len(final_matches)}명")
+        logger.info("최종 선정 완료: %d명", len(final_matches))
         
         if not final_matches:
             raise MatchingProcessError("final_selection", "최종 후보 선정에 실패했습니다",
@@ -138,11 +168,11 @@ async def recommend_matching(request: MatchingRequestDTO):
             matchedCaregivers=matched_caregiver_dtos,
             totalCandidates=len(all_caregivers),
             matchedCount=len(matched_caregiver_dtos),
-            processingTimeMs=int((datetime.now() - start_time).total_seconds() * 1000)
+            processingTimeMs=int((time.perf_counter() - start_time) * 1000)
         )
         
-        logger.info(f"매칭 완료 - 최종 선정: {len(matched_caregiver_dtos)}명, "
-                   f"처리시간: {response.processingTimeMs}ms")
+        logger.info("매칭 완료 - 최종 선정: %d명, 처리시간: %dms",
+                   len(matched_caregiver_dtos), response.processingTimeMs)
         return response
         
     except MatchingProcessError as e:
@@ -192,15 +222,7 @@ async def validate_service_request(request: MatchingRequestDTO) -> Tuple[float,
             raise MatchingProcessError("request_validation", "위치 좌표 파싱 실패", 
                                      {"location": str(request.serviceRequest.location), "error": str(e)})
         
-        # 좌표 범위 검증
-        if not (-90 <= latitude <= 90):
-            raise MatchingProcessError("request_validation", "위도가 범위를 벗어났습니다",
-                                     {"latitude": latitude})
-        
-        if not (-180 <= longitude <= 180):
-            raise MatchingProcessError("request_validation", "경도가 범위를 벗어났습니다",
-                                     {"longitude": longitude})
-        
+        # 좌표 범위는 LocationDTO 필드 제약(ge/le)으로 요청 파싱 시 이미 검증됨
         return (latitude, longitude)
         
     except Exception as e:
@@ -210,7 +232,7 @@ async def validate_service_request(request: MatchingRequestDTO) -> Tuple[float,
 
 async def filter_by_time_preferences(
     caregivers: List[CaregiverForMatchingDTO],
-    service_request: Any
+    service_request: ServiceRequestDTO
 ) -> List[CaregiverForMatchingDTO]:
     """선호시간대 필터링: 신청자 선호시간대와 요양보호사 근무시간대 겹침 확인"""
     try:
@@ -218,48 +240,58 @@ async def filter_by_time_preferences(
             raise MatchingProcessError("time_preference_filtering", "요양보호사 후보군이 제공되지 않았습니다")
         
         # 신청자의 선호시간대 추출
-        preferred_start_time = getattr(service_request, 'preferredStartTime', None)
-        preferred_end_time = getattr(service_request, 'preferredEndTime', None)
-        
-        # 요양보호사 정보를 딕셔너리 리스트로 변환
-        caregiver_dicts = []
-        for caregiver in caregivers:
-            caregiver_dict = {
-                'caregiver_id': caregiver.caregiverId,
-                'user_id': caregiver.userId,
-                'work_start_time': getattr(caregiver, 'workStartTime', None),
-                'work_end_time': getattr(caregiver, 'workEndTime', None),
-                'base_location': caregiver.baseLocation,
-                'career_years': caregiver.careerYears or 0,
-                'work_area': caregiver.workArea
-            }
-            caregiver_dicts.append(caregiver_dict)
+        preferred_start_time = service_request.preferredStartTime
+        preferred_end_time = service_request.preferredEndTime
         
-        # 시간대 필터링 적용
-        filtered_caregivers = filter_caregivers_by_time_preference(
-            caregiver_dicts, preferred_start_time, preferred_end_time
-        )
+        if not preferred_start_time or not preferred_end_time:
+            logger.info("신청자 선호시간대 정보가 없어 모든 요양보호사 통과")
+            return caregivers
         
-        # 필터링된 요양보호사 DTO로 변환
-        filtered_dtos = []
-        for caregiver_dict in filtered_caregivers:
-            caregiver_dto = CaregiverForMatchingDTO(
-                caregiverId=caregiver_dict['caregiver_id'],
-                userId=caregiver_dict['user_id'],
-                baseLocation=caregiver_dict['base_location'],
-                careerYears=caregiver_dict['career_years'],
-                workArea=caregiver_dict['work_area'],
-                workStartTime=caregiver_dict['work_start_time'],
-                workEndTime=caregiver_dict['work_end_time']
-            )
-            filtered_dtos.append(caregiver_dto)
+        preferred_start = time_to_minutes(preferred_start_time)
+        preferred_end = time_to_minutes(preferred_end_time)
+        if preferred_start is None or preferred_end is None:
+            logger.warning("신청자 선호시간대 파싱 실패로 모든 요양보호사 통과")
+            return caregivers
         
-        logger.info(f"시간대 필터링 완료: 전체 {len(caregivers)}명 중 {len(filtered_dtos)}명 통과")
+        # 근무시간 배열 구성과 겹침 계산은 CPU 작업이므로 워커 스레드에서 수행해 이벤트 루프를 막지 않음
+        filtered_dtos = await asyncio.to_thread(
+            select_time_matched_caregivers, caregivers, preferred_start, preferred_end
+        )
+        
+        logger.info("시간대 필터링 완료: 전체 %d명 중 %d명 통과", len(caregivers), len(filtered_dtos))
         return filtered_dtos
         
     except Exception as e:
         raise MatchingProcessError("time_preference_filtering", f"선호시간대 필터링 중 오류: {str(e)}")
 
+def select_time_matched_caregivers(
+    caregivers: List[CaregiverForMatchingDTO],
+    preferred_start: int,
+    preferred_end: int
+) -> List[CaregiverForMatchingDTO]:
+    """근무시간대가 선호시간대(자정 기준 분)와 겹치는 요양보호사 반환 (동기 함수)"""
+    # 요양보호사별 dict 대신 근무시간을 분 단위 정수 배열로 모아서 한 번에 비교
+    # (근무시간이 없거나 파싱에 실패한 경우 -1로 두고 기본적으로 통과)
+    count = len(caregivers)
+    work_starts = np.full(count, -1, dtype=np.int32)
+    work_ends = np.full(count, -1, dtype=np.int32)
+    for index, caregiver in enumerate(caregivers):
+        start_minutes = caregiver.workStartMinutes
+        if start_minutes is None and caregiver.workStartTime:
+            start_minutes = time_to_minutes(caregiver.workStartTime)
+        end_minutes = caregiver.workEndMinutes
+        if end_minutes is None and caregiver.workEndTime:
+            end_minutes = time_to_minutes(caregiver.workEndTime)
+        if start_minutes is not None and end_minutes is not None:
+            work_starts[index] = start_minutes
+            work_ends[index] = end_minutes
+    
+    # 시간대 필터링 적용
+    passed = (work_starts < 0) | minutes_overlap_mask(preferred_start, preferred_end, work_starts, work_ends)
+    filtered_dtos = [caregivers[index] for index in np.flatnonzero(passed).tolist()]
+    
+    return filtered_dtos
+
 async def load_nearby_caregivers(
     service_location: Tuple[float, float],
     all_caregivers: List[CaregiverForMatchingDTO]
@@ -269,82 +301,89 @@ async def load_nearby_caregivers(
         if not all_caregivers:
             raise MatchingProcessError("radius_filtering", "요양보호사 후보군이 제공되지 않았습니다")
         
-        import math
-        
-        def calculate_distance_km(lat1, lon1, lat2, lon2):
-            """Haversine 공식을 사용한 거리 계산 (km)"""
-            R = 6371  # 지구 반지름 (km)
-            
-            lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
-            dlat = lat2 - lat1
-            dlon = lon2 - lon1
-            
-            a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-            c = 2 * math.asin(math.sqrt(a))
-            
-            return R * c
-        
-        # 15km 반경 내 필터링
-        filtered_caregivers = []
-        service_lat, service_lon = service_location
-        
-        for caregiver in all_caregivers:
-            location_to_use = caregiver.location or caregiver.baseLocation
-            logger.info(f"Caregiver {caregiver.caregiverId[:8]}... location: {caregiver.location}, baseLocation: {caregiver.baseLocation}")
-            if location_to_use:
-                try:
-                    # 요양보호사 위치 파싱 "위도,경도"
-                    parts = location_to_use.split(',')
-                    if len(parts) == 2:
-                        caregiver_lat = float(parts[0].strip())
-                        caregiver_lon = float(parts[1].strip())
-                        
-                        # 거리 계산
-                        distance_km = calculate_distance_km(
-                            service_lat, service_lon, 
-                            caregiver_lat, caregiver_lon
-                        )
-                        
-                        logger.info(f"Caregiver {caregiver.caregiverId[:8]}... at {caregiver_lat},{caregiver_lon} is {distance_km:.2f}km away")
-                        
-                        # 15km 반경 내인 경우만 추가
-                        if distance_km <= 15.0:
-                            filtered_caregivers.append((caregiver, distance_km))
-                            
-                except (ValueError, IndexError) as e:
-                    # 위치 정보 파싱 실패 시 무시
-                    logger.warning(f"Failed to parse location for caregiver {caregiver.caregiverId}: {location_to_use}, error: {e}")
-                    continue
-            else:
-                logger.warning(f"Caregiver {caregiver.caregiverId[:8]}... has no location data")
+        # 위치 파싱과 거리 계산은 CPU 작업이므로 워커 스레드에서 수행해 이벤트 루프를 막지 않음
+        filtered_caregivers = await asyncio.to_thread(select_nearby_caregivers, service_location, all_caregivers)
         
-        logger.info(f"전체 {len(all_caregivers)}명 중 15km 반경 내 {len(filtered_caregivers)}명 필터링")
+        logger.info("전체 %d명 중 15km 반경 내 %d명 필터링", len(all_caregivers), len(filtered_caregivers))
         
         return filtered_caregivers
         
     except Exception as e:
         raise MatchingProcessError("radius_filtering", f"근거리 후보군 로드 중 오류: {str(e)}")
 
+def select_nearby_caregivers(
+    service_location: Tuple[float, float],
+    all_caregivers: List[CaregiverForMatchingDTO]
+) -> List[Tuple[CaregiverForMatchingDTO, float]]:
+    """요양보호사 위치를 파싱하여 반경 15km 내 후보와 거리를 반환 (동기 함수)"""
+    service_lat, service_lon = service_location
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    
+    # 요양보호사 위치 → 위도/경도 배열 (최대 크기로 한 번 할당 후 위치가 있는 요양보호사만 순서대로 채움)
+    located_caregivers = []
+    caregiver_lats = np.empty(len(all_caregivers), dtype=np.float64)
+    caregiver_lons = np.empty(len(all_caregivers), dtype=np.float64)
+    
+    for caregiver in all_caregivers:
+        # DB에서 읽은 위경도 실수 값이 있으면 문자열 파싱 없이 바로 사용
+        if caregiver.latitude is not None and caregiver.longitude is not None:
+            caregiver_lats[len(located_caregivers)] = caregiver.latitude
+            caregiver_lons[len(located_caregivers)] = caregiver.longitude
+            located_caregivers.append(caregiver)
+            continue
+        
+        location_to_use = caregiver.location or caregiver.baseLocation
+        if debug_enabled:
+            logger.debug("Caregiver %s... location: %s, baseLocation: %s", caregiver.caregiverId[:8], caregiver.location, caregiver.baseLocation)
+        if location_to_use:
+            coordinates = parse_lat_lon(location_to_use)
+            if coordinates is None:
+                # 위치 정보 파싱 실패 시 무시
+                logger.warning(f"Failed to parse location for caregiver {caregiver.caregiverId}: {location_to_use}")
+                continue
+            caregiver_lats[len(located_caregivers)] = coordinates[0]
+            caregiver_lons[len(located_caregivers)] = coordinates[1]
+            located_caregivers.append(caregiver)
+        else:
+            logger.warning(f"Caregiver {caregiver.caregiverId[:8]}... has no location data")
+    
+    # 경계 상자 필터 + Haversine 거리 계산 + 15km 반경 필터를 한 번에 수행 (원래 순서 유지)
+    located_count = len(located_caregivers)
+    indices, distances = find_within_radius(
+        service_lat, service_lon,
+        caregiver_lats[:located_count], caregiver_lons[:located_count],
+        radius_km=15.0
+    )
+    filtered_caregivers = []
+    for index, distance_km in zip(indices.tolist(), distances.tolist()):
+        filtered_caregivers.append((located_caregivers[index], distance_km))
+        if debug_enabled:
+            logger.debug("Caregiver %s... is %.2fkm away", located_caregivers[index].caregiverId[:8], distance_km)
+    
+    return filtered_caregivers
+
 async def filter_by_preferences(
     nearby_candidates: List[Tuple[CaregiverForMatchingDTO, float]], 
     request: MatchingRequestDTO
 ) -> List[Tuple[CaregiverForMatchingDTO, float]]:
     """LLM 선호조건 변환 및 필터링으로 조건부합 후보군 생성"""
     try:
-        logger.info(f"LLM 선호조건 필터링 시작: {len(nearby_candidates)}명의 후보군")
+        logger.info("LLM 선호조건 필터링 시작: %d명의 후보군", len(nearby_candidates))
         
         qualified_candidates = []
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
         for caregiver, distance in nearby_candidates:
             try:
                 # 요양보호사의 선호조건이 있는 경우에만 LLM 변환 수행
-                if hasattr(caregiver, 'preferences') and caregiver.preferences:
-                    logger.info(f"요양보호사 ID {caregiver.caregiverId}의 선호조건 분석 중")
+                if caregiver.preferences:
+                    if debug_enabled:
+                        logger.debug("요양보호사 ID %s의 선호조건 분석 중", caregiver.caregiverId)
                     
                     # 선호조건 텍스트 구성 (구조화된 데이터를 텍스트로 변환)
-                    preferences_text = f"근무시간: {getattr(caregiver.preferences, 'work_start_time', '')}-{getattr(caregiver.preferences, 'work_end_time', '')}, " \
-                                     f"선호 서비스: {getattr(caregiver.preferences, 'service_types', [])}, " \
-                                     f"지원 질환: {getattr(caregiver.preferences, 'supported_conditions', [])}"
+                    preferences_text = f"근무시간: {caregiver.preferences.work_start_time}-{caregiver.preferences.work_end_time}, " \
+                                     f"선호 서비스: {caregiver.preferences.service_types}, " \
+                                     f"지원 질환: {caregiver.preferences.supported_conditions}"
                     
                     # LLM 서비스 호출하여 비정형 텍스트를 정형 데이터로 변환
                     convert_request = ConvertNonStructuredDataToStructuredDataRequest(
@@ -357,20 +396,22 @@ async def filter_by_preferences(
                     
                     if is_qualified:
                         qualified_candidates.append((caregiver, distance))
-                        logger.info(f"요양보호사 ID {caregiver.caregiverId} 조건 부합 - 선정")
-                    else:
-                        logger.info(f"요양보호사 ID {caregiver.caregiverId} 조건 불일치 - 제외")
+                        if debug_enabled:
+                            logger.debug("요양보호사 ID %s 조건 부합 - 선정", caregiver.caregiverId)
+                    elif debug_enabled:
+                        logger.debug("요양보호사 ID %s 조건 불일치 - 제외", caregiver.caregiverId)
                 else:
                     # 선호조건이 없는 경우 기본적으로 통과
                     qualified_candidates.append((caregiver, distance))
-                    logger.info(f"요양보호사 ID {caregiver.caregiverId} 선호조건 없음 - 기본 선정")
+                    if debug_enabled:
+                        logger.debug("요양보호사 ID %s 선호조건 없음 - 기본 선정", caregiver.caregiverId)
                     
             except Exception as e:
                 logger.warning(f"요양보호사 ID {caregiver.caregiverId} 필터링 중 오류: {str(e)} - 기본 선정")
                 # 오류 발생 시 기본적으로 통과
                 qualified_candidates.append((caregiver, distance))
         
-        logger.info(f"LLM 선호조건 필터링 완료: {len(qualified_candidates)}명 선정")
+        logger.info("LLM 선호조건 필터링 완료: %d명 선정", len(qualified_candidates))
         return qualified_candidates
         
     except Exception as e:
@@ -387,36 +428,31 @@ async def calculate_travel_times(
         # 요양보호사 위치들을 추출 (Tuple[float, float] 형식으로 변환)
         caregiver_locations = []
         for caregiver, distance_km in qualified_candidates:
-            if caregiver.location:
-                try:
-                    parts = caregiver.location.split(',')
-                    if len(parts) == 2:
-                        lat = float(parts[0].strip())
-                        lon = float(parts[1].strip())
-                        caregiver_locations.append((lat, lon))
-                except (ValueError, IndexError):
-                    # 파싱 실패 시 기본값 사용
-                    caregiver_locations.append(service_location)
+            if caregiver.location and caregiver.latitude is not None and caregiver.longitude is not None:
+                caregiver_locations.append((caregiver.latitude, caregiver.longitude))
             else:
-                caregiver_locations.append(service_location)
+                # 파싱 실패 또는 위치 정보가 없으면 기본값 사용
+                caregiver_locations.append(parse_lat_lon(caregiver.location) or service_location)
         
-        logger.info(f"네이버 Direction API로 {len(caregiver_locations)}명의 ETA 계산 시작")
+        logger.info("네이버 Direction API로 %d명의 ETA 계산 시작", len(caregiver_locations))
         
         # 배치 ETA 계산 (요양보호사 위치 → 서비스 요청 위치)
-        eta_results = await eta_calculator.batch_calculate_eta(
-            origins=caregiver_locations,
-            destination=service_location
-        )
+        # 동시에 들어온 다른 매칭 요청과 함께 하나의 배치로 계산됨
+        eta_results = await asyncio.gather(*(
+            eta_batcher.submit(origin, service_location)
+            for origin in caregiver_locations
+        ))
         
         # 결과 조합
         for (caregiver, distance_km), eta_minutes in zip(qualified_candidates, eta_results):
             eta_calculated_candidates.append((caregiver, eta_minutes, distance_km))
         
-        logger.info(f"네이버 Direction API ETA 계산 완료: {len(eta_calculated_candidates)}명")
+        logger.info("네이버 Direction API ETA 계산 완료: %d명", len(eta_calculated_candidates))
         
-        # 로깅으로 ETA 결과 확인
-        for i, (caregiver, eta, distance) in enumerate(eta_calculated_candidates, 1):
-            logger.info(f"  {i}. {caregiver.caregiverId}: ETA {eta}분 (거리: {distance:.2f}km)")
+        # 로깅으로 ETA 결과 확인 (DEBUG 레벨에서만)
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, (caregiver, eta, distance) in enumerate(eta_calculated_candidates, 1):
+                logger.debug("  %d. %s: ETA %s분 (거리: %.2fkm)", i, caregiver.caregiverId, eta, distance)
         
         return eta_calculated_candidates
         
@@ -438,15 +474,12 @@ async def select_final_candidates(
 ) -> List[Tuple[CaregiverForMatchingDTO, int, float]]:
     """ETA 기준 정렬 후 최종 5명 선정"""
     try:
-        # ETA 기준 오름차순 정렬
-        sorted_candidates = sorted(eta_calculated_candidates, key=lambda x: x[1])
-        
-        # 최대 5명 선정
-        final_candidates = sorted_candidates[:5]
+        # ETA가 작은 순서대로 최대 5명 선정 (전체 정렬 없이 상위 5명만 선택, 동일 ETA는 기존 순서 유지)
+        final_candidates = heapq.nsmallest(5, eta_calculated_candidates, key=lambda x: x[1])
         
-        logger.info(f"ETA 기준 최종 {len(final_candidates)}명 선정")
+        logger.info("ETA 기준 최종 %d명 선정", len(final_candidates))
         for i, (caregiver, eta, distance) in enumerate(final_candidates, 1):
-            logger.info(f"{i}순위: {caregiver.caregiverId} (ETA: {eta}분, 거리: {distance:.2f}km)")
+            logger.info("%d순위: %s (ETA: %s분, 거리: %.2fkm)", i, caregiver.caregiverId, eta, distance)
         
         return final_candidates
         
@@ -463,7 +496,8 @@ async def create_response_dtos(
         
         for i, (caregiver, eta_minutes, distance_km) in enumerate(final_matches, 1):
             # caregiver는 이미 CaregiverForMatchingDTO이므로 직접 사용
-            matched_dto = MatchedCaregiverDTO(
+            # 모든 값이 DB/내부 계산 결과이므로 검증 없이 생성
+            matched_dto = MatchedCaregiverDTO.model_construct(
                 caregiverId=caregiver.caregiverId,
                 name=caregiver.name,
                 distanceKm=distance_km,
@@ -475,8 +509,8 @@ async def create_response_dtos(
                 location=caregiver.location,
                 career=caregiver.career,
                 selfIntroduction=caregiver.selfIntroduction,
-                isVerified=getattr(caregiver, 'verifiedStatus', None) == 'APPROVED',
-                serviceType=getattr(caregiver, 'serviceType', None)
+                isVerified=caregiver.verifiedStatus == 'APPROVED',
+                serviceType=caregiver.serviceType
             )
             matched_caregiver_dtos.append(matched_dto)
         
@@ -6,7 +6,6 @@ SQLAlchemy를 사용한 읽기 전용 데이터베이스 연결 설정
 import os
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
-from sqlalchemy.pool import NullPool
 from dotenv import load_dotenv
 
 # 환경 변수 로드
@@ -19,10 +18,13 @@ DATABASE_URL = os.getenv(
 )
 
 # 읽기 전용 비동기 엔진 생성
+# 요청마다 새 연결을 맺지 않도록 기본 커넥션 풀(AsyncAdaptedQueuePool)을 사용
 engine = create_async_engine(
     DATABASE_URL,
-    echo=True,  # 개발 환경에서 SQL 쿼리 로깅
-    poolclass=NullPool,
+    echo=os.getenv("SQL_ECHO", "0") == "1",  # SQL_ECHO=1 일 때만 SQL 쿼리 로깅 (개발용)
+    pool_size=10,
+    max_overflow=5,
+    pool_pre_ping=True,
     future=True
 )
 
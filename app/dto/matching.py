@@ -50,8 +50,8 @@ class CaregiverPreference(BaseModel):
 # 위치 정보를 위한 별도 클래스
 class LocationDTO(BaseModel):
     """위치 정보 DTO"""
-    latitude: float = Field(..., description="위도")
-    longitude: float = Field(..., description="경도")
+    latitude: float = Field(..., ge=-90, le=90, description="위도")
+    longitude: float = Field(..., ge=-180, le=180, description="경도")
 
 # 매칭 API에서 사용하는 DTO 클래스들 추가
 class ServiceRequestDTO(BaseModel):
@@ -76,6 +76,8 @@ class CaregiverForMatchingDTO(BaseModel):
     address: Optional[str] = Field(None, description="주소")
     addressType: Optional[str] = Field(None, description="주소 유형")
     location: Optional[str] = Field(None, description="위치 (위도,경도)")
+    latitude: Optional[float] = Field(None, description="위도 (location과 동일한 좌표, 파싱 없이 사용)")
+    longitude: Optional[float] = Field(None, description="경도 (location과 동일한 좌표, 파싱 없이 사용)")
     career: Optional[str] = Field(None, description="경력")
     koreanProficiency: Optional[str] = Field(None, description="한국어 능력")
     isAccompanyOuting: Optional[bool] = Field(None, description="외출 동행 가능 여부")
@@ -84,6 +86,8 @@ class CaregiverForMatchingDTO(BaseModel):
     # 매칭 처리를 위한 추가 속성들
     workStartTime: Optional[str] = Field(None, description="근무 시작 시간")
     workEndTime: Optional[str] = Field(None, description="근무 종료 시간")
+    workStartMinutes: Optional[int] = Field(None, description="근무 시작 시간 (자정 기준 분)")
+    workEndMinutes: Optional[int] = Field(None, description="근무 종료 시간 (자정 기준 분)")
     workArea: Optional[str] = Field(None, description="근무 지역")
     baseLocation: Optional[str] = Field(None, description="기본 위치 (위도,경도)")
     careerYears: Optional[int] = Field(None, description="경력 연수")
@@ -115,6 +119,6 @@ class MatchingResponseDTO(BaseModel):
     """매칭 응답 DTO"""
     serviceRequestId: str = Field(..., description="서비스 요청 ID")
     matchedCaregivers: List[MatchedCaregiverDTO] = Field(..., description="매칭된 요양보호사 목록")
-    totalCandidates: int = Field(..., description="전체 후보자 수")
+    totalCandidates: int = Field(..., description="전체 후보자 수 (서비스 위치 반경 15km 경계 상자 내 요양보호사 수)")
     matchedCount: int = Field(..., description="매칭된 요양보호사 수")
     processingTimeMs: Optional[int] = Field(None, description="처리 시간 (밀리초)")
\ No newline at end of file
@@ -1,26 +1,48 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 import logging
 import os
 from dotenv import load_dotenv
-from .api.matching import router
-from .api.converting import router as converting_router
+from .api.matching import router, eta_batcher, eta_calculator
+from .api.converting import router as converting_router, close_http_client
 
 # .env 파일 로드
 load_dotenv()
 
-# 로깅 설정
-logging.basicConfig(level=logging.INFO)
+# 로깅 설정 (애플리케이션 전체에서 한 번만 수행, 레벨은 LOG_LEVEL 환경변수로 지정)
+# LOG_LEVEL은 uvicorn --log-level과 공유되므로 logging에 없는 값(예: trace)은 INFO로 처리
+log_level = logging.getLevelName(os.getenv("LOG_LEVEL", "info").upper())
+if not isinstance(log_level, int):
+    log_level = logging.INFO
+logging.basicConfig(level=log_level)
 logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title="Homecare Matching API", 
     version="1.0.0",
-    description="요양보호사 매칭 서비스"
+    description="요양보호사 매칭 서비스",
+    default_response_class=ORJSONResponse
 )
 
 app.include_router(router, prefix="/matching", tags=["matching"])
 app.include_router(converting_router, prefix="/converting", tags=["converting"])
 
+@app.on_event("startup")
+async def start_eta_batcher():
+    """ETA 배치 워커 시작"""
+    eta_batcher.start()
+
+@app.on_event("shutdown")
+async def stop_eta_batcher():
+    """ETA 배치 워커 종료"""
+    await eta_batcher.stop()
+
+@app.on_event("shutdown")
+async def close_http_clients():
+    """요청 간 공유하던 HTTP 클라이언트 종료"""
+    await eta_calculator.close()
+    await close_http_client()
+
 @app.get("/health-check")
 def health():
     """헬스체크 엔드포인트"""
@@ -11,11 +11,11 @@ SQLAlchemy ORM 모델 정의 - 읽기 전용
 """
 
 from sqlalchemy import Column, String, Integer, Boolean, Float, ForeignKey
-from sqlalchemy.orm import relationship, declarative_base
+from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 
-# SQLAlchemy Base 모델
-Base = declarative_base()
+# SQLAlchemy Base 모델 (database.py의 Base를 공유하여 메타데이터 레지스트리를 하나로 유지)
+from ..database import Base
 
 class User(Base):
     __tablename__ = "users"
@@ -3,56 +3,101 @@
 SQLAlchemy ORM을 사용한 데이터베이스 조회 기능
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, lambda_stmt
+from sqlalchemy.orm import selectinload, raiseload, load_only
 from ..models.matching import Caregiver, CaregiverPreference, User, CaregiverDayOfWeek, CaregiverSupportedConditions
 from ..dto.matching import CaregiverForMatchingDTO
+from ..utils.time_utils import time_to_minutes
+from ..utils.location_calculator import get_bounding_box
 # LocationInfo 제거 - 더 이상 사용하지 않음
 
-async def get_all_caregivers(session: AsyncSession) -> List[CaregiverForMatchingDTO]:
+# 전체 요양보호사 조회 시 한 번에 가져오는 행 수
+CAREGIVER_FETCH_BATCH_SIZE = 500
+
+async def get_all_caregivers(
+    session: AsyncSession,
+    center: Optional[Tuple[float, float]] = None,
+    radius_km: float = 15.0
+) -> List[CaregiverForMatchingDTO]:
     """
     데이터베이스에서 모든 요양보호사 정보를 조회하여 DTO로 변환
     caregiver와 caregiver_preference 테이블을 명시적으로 조인하여 모든 필요한 정보를 가져옴
+    
+    center(위도, 경도)가 주어지면 반경을 포함하는 위경도 경계 상자 안의 요양보호사만 조회
+    (정확한 반경 필터링은 이후 Haversine 계산에서 수행)
     """
     try:
         # 요양보호사와 선호도 정보를 함께 조회
-        stmt = (
-            select(Caregiver, CaregiverPreference, User)
-            .outerjoin(CaregiverPreference, CaregiverPreference.caregiver_id == Caregiver.id)
+        # 위치 정보가 없는 요양보호사는 매칭에 쓰이지 않으므로 DB에서 미리 제외
+        # 조회 결과를 수정하지 않으므로 ORM 엔티티 대신 DTO 변환에 쓰는 컬럼만 행(Row)으로 조회
+        # (ORM 객체 생성/identity map 관리 비용 없음, 주소/이메일 등 미사용 컬럼은 전송하지 않음)
+        # lambda_stmt로 구성해 SQL 컴파일 결과를 호출 간에 캐시 (경계 상자 값은 바인드 파라미터로 전달)
+        stmt = lambda_stmt(lambda: (
+            select(
+                Caregiver.caregiver_id, Caregiver.career, Caregiver.korean_proficiency,
+                Caregiver.is_accompany_outing, Caregiver.self_introduction, Caregiver.verified_status,
+                CaregiverPreference.work_start_time, CaregiverPreference.work_end_time,
+                CaregiverPreference.work_area, CaregiverPreference.address_type,
+                CaregiverPreference.latitude, CaregiverPreference.longitude,
+                CaregiverPreference.transportation,
+                User.user_id.label("user_uuid"), User.name
+            )
+            .join(CaregiverPreference, CaregiverPreference.caregiver_id == Caregiver.id)
             .join(User, User.id == Caregiver.user_id)
-            .where(Caregiver.verified_status == "APPROVED")
-        )
+            .where(
+                Caregiver.verified_status == "APPROVED",
+                CaregiverPreference.latitude.is_not(None),
+                CaregiverPreference.longitude.is_not(None)
+            )
+        ))
         
-        result = await session.execute(stmt)
-        rows = result.all()
+        if center is not None:
+            min_lat, max_lat, min_lon, max_lon = get_bounding_box(center[0], center[1], radius_km)
+            stmt += lambda s: s.where(
+                CaregiverPreference.latitude.between(min_lat, max_lat),
+                CaregiverPreference.longitude.between(min_lon, max_lon)
+            )
         
-        # ORM 모델을 DTO로 변환
+        # 서버 측 커서로 CAREGIVER_FETCH_BATCH_SIZE 행씩 받아 바로 DTO로 변환
+        # (전체 행을 한꺼번에 메모리에 올리지 않음)
+        result = await session.stream(stmt, execution_options={"yield_per": CAREGIVER_FETCH_BATCH_SIZE})
+        
+        # 조회 행을 DTO로 변환
         caregiver_dtos = []
-        for caregiver, pref, user in rows:
+        async for row in result:
             # 위치 정보가 있는 경우에만 처리
-            if pref.latitude is not None and pref.longitude is not None:
-                caregiver_dto = CaregiverForMatchingDTO(
-                    caregiverId=str(caregiver.caregiver_id),
-                    userId=str(user.user_id),
-                    name=user.name if user else None,
-                    address=pref.work_area if pref else None,
-                    addressType=pref.address_type if pref else None,
-                    location=f"{pref.latitude},{pref.longitude}" if pref.latitude and pref.longitude else None,
-                    career=str(caregiver.career) if caregiver.career else None,
-                    koreanProficiency=caregiver.korean_proficiency,
-                    isAccompanyOuting=caregiver.is_accompany_outing,
-                    selfIntroduction=caregiver.self_introduction,
-                    verifiedStatus=caregiver.verified_status,
+            if row.latitude is not None and row.longitude is not None:
+                work_start_time = str(row.work_start_time) if row.work_start_time else None
+                work_end_time = str(row.work_end_time) if row.work_end_time else None
+                location = f"{row.latitude},{row.longitude}" if row.latitude and row.longitude else None
+                # DB에서 조회한 신뢰 가능한 값이므로 검증 없이 생성
+                caregiver_dto = CaregiverForMatchingDTO.model_construct(
+                    caregiverId=str(row.caregiver_id),
+                    userId=str(row.user_uuid),
+                    name=row.name,
+                    address=row.work_area,
+                    addressType=row.address_type,
+                    location=location,
+                    latitude=row.latitude if location else None,
+                    longitude=row.longitude if location else None,
+                    career=str(row.career) if row.career else None,
+                    koreanProficiency=row.korean_proficiency,
+                    isAccompanyOuting=row.is_accompany_outing,
+                    selfIntroduction=row.self_introduction,
+                    verifiedStatus=row.verified_status,
                     # 추가 정보들을 preferences에서 안전하게 가져와서 설정
-                    workStartTime=str(pref.work_start_time) if pref and pref.work_start_time else None,
-                    workEndTime=str(pref.work_end_time) if pref and pref.work_end_time else None,
-                    workArea=pref.work_area if pref else None,
+                    workStartTime=work_start_time,
+                    workEndTime=work_end_time,
+                    # 시간 비교용 분 단위 값은 로드 시점에 한 번만 계산
+                    workStartMinutes=time_to_minutes(work_start_time),
+                    workEndMinutes=time_to_minutes(work_end_time),
+                    workArea=row.work_area,
                     serviceType=None,  # service_types 컬럼이 없으므로 None
-                    baseLocation=f"{pref.latitude},{pref.longitude}" if pref.latitude and pref.longitude else None,
-                    careerYears=caregiver.career if caregiver.career else None,
-                    transportation=pref.transportation if pref else None,
+                    baseLocation=location,
+                    careerYears=row.career if row.career else None,
+                    transportation=row.transportation,
                     preferences=None  # 필요시 별도로 처리
                 )
                 caregiver_dtos.append(caregiver_dto)
@@ -60,10 +105,9 @@ async def get_all_caregivers(session: AsyncSession) -> List[CaregiverForMatching
         return caregiver_dtos
         
     except Exception as e:
-        # 데이터베이스 조회 실패 시 빈 리스트 반환
-        # 실제 운영에서는 적절한 에러 처리 필요
+        # 조회 실패를 "요양보호사 없음"(빈 리스트)과 구분할 수 있도록 호출 측에 그대로 전달
         print(f"데이터베이스 조회 오류: {str(e)}")  # 디버깅을 위한 로그
-        return []
+        raise
 
 async def get_caregiver_by_id(session: AsyncSession, caregiver_id: str) -> Optional[CaregiverForMatchingDTO]:
     """
@@ -71,12 +115,29 @@ async def get_caregiver_by_id(session: AsyncSession, caregiver_id: str) -> Optio
     """
     try:
     
-        stmt = (
+        # lambda_stmt로 SQL 컴파일 결과를 캐시 (caregiver_id는 바인드 파라미터로 전달)
+        stmt = lambda_stmt(lambda: (
             select(Caregiver, CaregiverPreference, User)
             .outerjoin(CaregiverPreference, CaregiverPreference.caregiver_id == Caregiver.id)
             .join(User, User.id == Caregiver.user_id)
             .where(Caregiver.caregiver_id == caregiver_id, Caregiver.verified_status == "APPROVED")
-        )
+            # DTO 변환에 쓰는 컬럼만 한 번의 조인 쿼리로 조회
+            .options(
+                load_only(
+                    Caregiver.caregiver_id, Caregiver.user_id, Caregiver.career,
+                    Caregiver.korean_proficiency, Caregiver.is_accompany_outing,
+                    Caregiver.self_introduction, Caregiver.verified_status,
+                    raiseload=True
+                ),
+                load_only(
+                    CaregiverPreference.work_area, CaregiverPreference.address_type,
+                    CaregiverPreference.latitude, CaregiverPreference.longitude,
+                    raiseload=True
+                ),
+                load_only(User.name, raiseload=True),
+                raiseload("*")
+            )
+        ))
 
         result = await session.execute(stmt)
         row = result.one_or_none()
@@ -89,13 +150,15 @@ async def get_caregiver_by_id(session: AsyncSession, caregiver_id: str) -> Optio
         if pref.latitude is None or pref.longitude is None:
             return None
         
-        return CaregiverForMatchingDTO(
+        return CaregiverForMatchingDTO.model_construct(
             caregiverId=str(caregiver.caregiver_id),
             userId=str(caregiver.user_id),
             name=user.name if user else None,
             address=pref.work_area if pref else None,
             addressType=pref.address_type if pref else None,
             baseLocation=f"{pref.latitude},{pref.longitude}",
+            latitude=pref.latitude,
+            longitude=pref.longitude,
             career=str(caregiver.career) if caregiver.career else None,
             koreanProficiency=caregiver.korean_proficiency,
             isAccompanyOuting=caregiver.is_accompany_outing,
@@ -5,11 +5,41 @@
 두 지점 간의 거리를 계산하는 모듈입니다.
 """
 
+from __future__ import annotations
+
 import math
-from typing import List, Tuple
-from app.models.matching import LocationInfo, CaregiverForMatching
+from functools import lru_cache
+from typing import List, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from app.models.matching import LocationInfo, CaregiverForMatching
 
 
+@lru_cache(maxsize=8192)
+def parse_lat_lon(location: Optional[str]) -> Optional[Tuple[float, float]]:
+    """
+    "위도,경도" 문자열을 (위도, 경도) 튜플로 파싱합니다.
+    
+    같은 위치 문자열이 요청마다 반복되므로 파싱 결과를 캐시합니다.
+    
+    Args:
+        location: "위도,경도" 형식의 문자열
+    
+    Returns:
+        Optional[Tuple[float, float]]: (위도, 경도) 또는 파싱 실패 시 None
+    """
+    if not location:
+        return None
+    parts = location.split(',')
+    if len(parts) != 2:
+        return None
+    try:
+        return float(parts[0].strip()), float(parts[1].strip())
+    except ValueError:
+        return None
+
 def calculate_distance_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     두 지점 간의 직선 거리를 Haversine 공식으로 계산합니다.
@@ -28,25 +58,120 @@ def calculate_distance_km(lat1: float, lon1: float, lat2: float, lon2: float) ->
     
     # 위도와 경도를 라디안으로 변환
     lat1_rad = math.radians(lat1)
-    lon1_rad = math.radians(lon1)
     lat2_rad = math.radians(lat2)
-    lon2_rad = math.radians(lon2)
     
     # 위도와 경도 차이
     dlat = lat2_rad - lat1_rad
-    dlon = lon2_rad - lon1_rad
+    dlon = math.radians(lon2) - math.radians(lon1)
     
     # Haversine 공식
     a = (math.sin(dlat / 2) ** 2 + 
          math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2)
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    # 2*atan2(√a, √(1-a))와 동일하지만 sqrt 한 번과 asin으로 계산 (부동소수 오차 대비 1로 제한)
+    c = 2 * math.asin(math.sqrt(min(1.0, a)))
     
-    # 거리 계산
     distance = R * c
     
     return round(distance, 2)
 
 
+def calculate_distances_km(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """
+    한 지점에서 여러 지점까지의 직선 거리를 Haversine 공식으로 한 번에 계산합니다.
+    
+    Args:
+        lat: 기준 지점의 위도
+        lon: 기준 지점의 경도
+        lats: 대상 지점들의 위도 배열
+        lons: 대상 지점들의 경도 배열
+    
+    Returns:
+        np.ndarray: 각 대상 지점까지의 거리 (km)
+    """
+    # 지구의 반지름 (km)
+    R = 6371.0
+    
+    # 기준 지점은 한 번만 변환
+    lat1_rad = math.radians(lat)
+    lon1_rad = math.radians(lon)
+    cos_lat1 = math.cos(lat1_rad)
+    
+    lat2_rad = np.radians(np.asarray(lats, dtype=np.float64))
+    
+    # Haversine 공식 (배열 단위 연산)
+    # 중간 결과마다 새 배열을 만들지 않도록 out= 으로 버퍼를 재사용
+    a = np.radians(np.asarray(lons, dtype=np.float64))
+    a -= lon1_rad
+    a *= 0.5
+    np.sin(a, out=a)
+    np.square(a, out=a)
+    a *= np.cos(lat2_rad)
+    a *= cos_lat1
+    
+    half_dlat = lat2_rad
+    half_dlat -= lat1_rad
+    half_dlat *= 0.5
+    np.sin(half_dlat, out=half_dlat)
+    np.square(half_dlat, out=half_dlat)
+    a += half_dlat
+    
+    np.minimum(a, 1.0, out=a)
+    np.sqrt(a, out=a)
+    np.arcsin(a, out=a)
+    a *= 2 * R
+    return a
+
+
+def get_bounding_box(lat: float, lon: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """
+    기준 지점 반경을 포함하는 위경도 경계 상자를 계산합니다.
+    
+    위도 1도 ≈ 111km보다 약간 작게 잡아 상자가 반경 원을 항상 포함하도록 합니다.
+    
+    Args:
+        lat: 기준 지점의 위도
+        lon: 기준 지점의 경도
+        radius_km: 반경 (km)
+    
+    Returns:
+        Tuple[float, float, float, float]: (최소 위도, 최대 위도, 최소 경도, 최대 경도)
+    """
+    lat_delta = radius_km / 111.0
+    lon_delta = radius_km / (111.0 * max(math.cos(math.radians(lat)), 1e-6))
+    return lat - lat_delta, lat + lat_delta, lon - lon_delta, lon + lon_delta
+
+def find_within_radius(
+    lat: float, lon: float, lats: np.ndarray, lons: np.ndarray, radius_km: float = 15.0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    기준 지점 반경 내에 있는 지점들의 인덱스와 거리를 한 번에 계산합니다.
+    
+    경계 상자 필터, Haversine 거리 계산, 반경 필터를 하나의 배열 연산 흐름으로 처리합니다.
+    
+    Args:
+        lat: 기준 지점의 위도
+        lon: 기준 지점의 경도
+        lats: 대상 지점들의 위도 배열
+        lons: 대상 지점들의 경도 배열
+        radius_km: 반경 (km, 기본값: 15km)
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (반경 내 지점의 원래 인덱스, 거리(km)), 원래 순서 유지
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    
+    # Haversine 계산 전 위경도 경계 상자로 먼 지점을 먼저 제외
+    min_lat, max_lat, min_lon, max_lon = get_bounding_box(lat, lon, radius_km)
+    box_indices = np.flatnonzero(
+        (lats >= min_lat) & (lats <= max_lat) & (lons >= min_lon) & (lons <= max_lon)
+    )
+    
+    # 경계 상자 안의 지점만 거리 계산 후 반경 필터 적용
+    distances = calculate_distances_km(lat, lon, lats[box_indices], lons[box_indices])
+    within_radius = distances <= radius_km
+    return box_indices[within_radius], distances[within_radius]
+
 def is_within_radius(
     center_location: LocationInfo, 
     target_location: LocationInfo, 
@@ -88,21 +213,19 @@ def filter_caregivers_by_distance(
         List[Tuple[CaregiverForMatching, float]]: (요양보호사, 거리) 튜플 리스트
         거리 순으로 정렬됨
     """
-    filtered_caregivers = []
+    if not caregivers:
+        return []
     
-    for caregiver in caregivers:
-        distance = calculate_distance_km(
-            request_location.y, request_location.x,
-            caregiver.base_location.y, caregiver.base_location.x
-        )
-        
-        if distance <= radius_km:
-            filtered_caregivers.append((caregiver, distance))
+    # 요양보호사 좌표를 배열로 모아 한 번의 벡터 연산으로 거리 계산
+    lats = np.fromiter((caregiver.base_location.y for caregiver in caregivers), dtype=np.float64, count=len(caregivers))
+    lons = np.fromiter((caregiver.base_location.x for caregiver in caregivers), dtype=np.float64, count=len(caregivers))
+    distances = np.round(calculate_distances_km(request_location.y, request_location.x, lats, lons), 2)
     
-    # 거리 순으로 정렬
-    filtered_caregivers.sort(key=lambda x: x[1])
+    # 반경 내 인덱스만 거리 순으로 정렬 (동일 거리는 원래 순서 유지)
+    within_radius = np.flatnonzero(distances <= radius_km)
+    order = within_radius[np.argsort(distances[within_radius], kind="stable")]
     
-    return filtered_caregivers
+    return [(caregivers[index], distance) for index, distance in zip(order.tolist(), distances[order].tolist())]
 
 
 def get_nearby_caregivers_ids(
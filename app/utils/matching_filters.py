@@ -11,6 +11,7 @@ from datetime import datetime
 
 from ..dto.matching import MatchingRequestDTO
 from ..models.matching import CaregiverForMatching
+from .time_utils import days_to_mask, time_to_minutes
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +24,7 @@ async def evaluate_caregiver_match(
     try:
         # LLM이 변환한 선호조건이 None이거나 필드들이 null인 경우 기본적으로 통과
         if structured_preferences is None:
-            logger.debug(f"요양보호사 {caregiver.caregiver_id}: 선호조건 없음 - 기본 통과")
+            logger.debug("요양보호사 %s: 선호조건 없음 - 기본 통과", caregiver.caregiver_id)
             return True
         
         # 필터링 로직 구현
@@ -31,30 +32,30 @@ async def evaluate_caregiver_match(
         
         # 1. 서비스 유형 필터링
         if not filter_by_service_type(structured_preferences, request):
-            logger.debug(f"요양보호사 {caregiver.caregiver_id} 서비스 유형 불일치")
+            logger.debug("요양보호사 %s 서비스 유형 불일치", caregiver.caregiver_id)
             return False
         
         # 2. 시간대 필터링
         if not filter_by_time_preferences(structured_preferences, request):
-            logger.debug(f"요양보호사 {caregiver.caregiver_id} 시간대 불일치")
+            logger.debug("요양보호사 %s 시간대 불일치", caregiver.caregiver_id)
             return False
         
         # 3. 지원 질환 필터링
         if not filter_by_supported_conditions(structured_preferences, request):
-            logger.debug(f"요양보호사 {caregiver.caregiver_id} 지원 질환 불일치")
+            logger.debug("요양보호사 %s 지원 질환 불일치", caregiver.caregiver_id)
             return False
         
         # 4. 선호 연령/성별 필터링
         if not filter_by_preferred_demographics(structured_preferences, request):
-            logger.debug(f"요양보호사 {caregiver.caregiver_id} 선호 연령/성별 불일치")
+            logger.debug("요양보호사 %s 선호 연령/성별 불일치", caregiver.caregiver_id)
             return False
         
         # 5. 요일 필터링
         if not filter_by_day_of_week(structured_preferences, request):
-            logger.debug(f"요양보호사 {caregiver.caregiver_id} 요일 불일치")
+            logger.debug("요양보호사 %s 요일 불일치", caregiver.caregiver_id)
             return False
         
-        logger.debug(f"요양보호사 {caregiver.caregiver_id} 모든 필터 조건 통과")
+        logger.debug("요양보호사 %s 모든 필터 조건 통과", caregiver.caregiver_id)
         return True
         
     except Exception as e:
@@ -87,12 +88,18 @@ def filter_by_time_preferences(structured_preferences: Any, request: MatchingReq
     if not request.serviceRequest.preferredStartTime or not request.serviceRequest.preferredEndTime:
         return True
     
-    # 시간대 비교 로직 (간단한 문자열 비교로 구현, 실제로는 시간 파싱 및 비교 필요)
-    # 여기서는 단순히 시간 문자열이 겹치는지 확인하는 예시
-    pref_start = structured_preferences.work_start_time
-    pref_end = structured_preferences.work_end_time
-    req_start = request.serviceRequest.preferredStartTime
-    req_end = request.serviceRequest.preferredEndTime
+    # 시간대 비교 로직 (분 단위 정수로 비교, 파싱 결과는 time_to_minutes에서 캐시됨)
+    pref_start = time_to_minutes(structured_preferences.work_start_time)
+    pref_end = time_to_minutes(structured_preferences.work_end_time)
+    req_start = time_to_minutes(request.serviceRequest.preferredStartTime)
+    req_end = time_to_minutes(request.serviceRequest.preferredEndTime)
+    
+    # 파싱에 실패하면 기존처럼 시간 문자열 그대로 비교
+    if None in (pref_start, pref_end, req_start, req_end):
+        pref_start = structured_preferences.work_start_time
+        pref_end = structured_preferences.work_end_time
+        req_start = request.serviceRequest.preferredStartTime
+        req_end = request.serviceRequest.preferredEndTime
     
     # 시간대가 겹치는지 확인 (예: 요청 시작시간이 선호 종료시간 전이고, 요청 종료시간이 선호 시작시간 후)
     return req_start <= pref_end and req_end >= pref_start
@@ -172,25 +179,12 @@ def filter_by_day_of_week(structured_preferences: Any, request: MatchingRequestD
     if not request.serviceRequest.requestDate:
         return True
     
-    # 요청 날짜에서 요일 추출 (간단한 구현)
+    # 요청 날짜의 요일 비트와 선호 요일 비트마스크 비교
     try:
-        from datetime import datetime
         request_date = datetime.strptime(request.serviceRequest.requestDate, "%Y-%m-%d")
-        request_weekday = request_date.strftime("%A")  # Monday, Tuesday, etc.
-        
-        # 한국어 요일 매핑 (간단한 예시)
-        weekday_map = {
-            "Monday": "월요일",
-            "Tuesday": "화요일",
-            "Wednesday": "수요일",
-            "Thursday": "목요일",
-            "Friday": "금요일",
-            "Saturday": "토요일",
-            "Sunday": "일요일"
-        }
+        request_day_mask = 1 << request_date.weekday()
         
-        korean_weekday = weekday_map.get(request_weekday, "")
-        if korean_weekday and korean_weekday in structured_preferences.day_of_week:
+        if days_to_mask(structured_preferences.day_of_week) & request_day_mask:
             return True
     except (ValueError, TypeError):
         # 날짜 파싱 실패 시 기본 통과
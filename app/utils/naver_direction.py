@@ -8,6 +8,7 @@ import os
 import asyncio
 import aiohttp
 import logging
+import orjson
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import json
@@ -21,12 +22,37 @@ class NaverDirectionClient:
     
     BASE_URL = "https://maps.apigw.ntruss.com/map-direction/v1/driving"
     
-    def __init__(self):
+    def __init__(self, max_concurrent: int = 3):
+        """
+        Args:
+            max_concurrent: 클라이언트 전체의 최대 동시 요청 수 (기본 3개, Rate Limiting 고려)
+        """
         self.client_id = os.getenv('NAVER_CLIENT_ID')
         self.client_secret = os.getenv('NAVER_CLIENT_SECRET')
         
         if not self.client_id or not self.client_secret:
             raise ValueError("NAVER_CLIENT_ID와 NAVER_CLIENT_SECRET 환경변수가 설정되어야 합니다")
+        
+        # 요청 간 재사용하는 HTTP 세션 (첫 호출 시 생성)
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # 동시 요청 수 제한은 호출(batch_calculate_eta)별이 아니라 클라이언트 전체에서 공유
+        # (여러 배치가 동시에 처리되어도 네이버 API로 나가는 동시 요청은 max_concurrent개 이하)
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """keep-alive 연결을 재사용하는 공유 세션 반환"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, keepalive_timeout=30)
+            )
+        return self._session
+    
+    async def close(self):
+        """공유 HTTP 세션 종료"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
     
     def _get_headers(self) -> Dict[str, str]:
         """API 요청에 필요한 헤더 생성"""
@@ -56,22 +82,22 @@ class NaverDirectionClient:
         try:
             request_params = self._build_request_params(origin, destination)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    self.BASE_URL,
-                    params=request_params,
-                    headers=self._get_headers(),
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
+            session = self._get_session()
+            async with session.get(
+                self.BASE_URL,
+                params=request_params,
+                headers=self._get_headers(),
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                
+                if response.status == 200:
+                    data = await response.json(loads=orjson.loads)
+                    return self._extract_travel_time(data)
+                else:
+                    error_text = await response.text()
+                    logger.error(f"네이버 Direction API 오류: {response.status}, {error_text}")
+                    return None
                     
-                    if response.status == 200:
-                        data = await response.json()
-                        return self._extract_travel_time(data)
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"네이버 Direction API 오류: {response.status}, {error_text}")
-                        return None
-                        
         except asyncio.TimeoutError:
             logger.error("네이버 Direction API 타임아웃")
             return None
@@ -79,7 +105,8 @@ class NaverDirectionClient:
             logger.error(f"네이버 Direction API 호출 오류: {str(e)}")
             return None
     
-    def _extract_travel_time(self, api_response: Dict[str, Any]) -> Optional[int]:
+    @staticmethod
+    def _extract_travel_time(api_response: Dict[str, Any]) -> Optional[int]:
         """
         API 응답에서 소요시간 추출
         
@@ -107,7 +134,7 @@ class NaverDirectionClient:
             # 밀리초를 분으로 변환
             duration_minutes = round(duration_ms / 1000 / 60)
             
-            logger.debug(f"계산된 소요시간: {duration_minutes}분 (원본: {duration_ms}ms)")
+            logger.debug("계산된 소요시간: %s분 (원본: %sms)", duration_minutes, duration_ms)
             
             return max(1, duration_minutes)  # 최소 1분
             
@@ -118,8 +145,7 @@ class NaverDirectionClient:
     async def batch_calculate_eta(
         self, 
         origins: List[Tuple[float, float]], 
-        destination: Tuple[float, float],
-        max_concurrent: int = 3
+        destination: Tuple[float, float]
     ) -> List[Tuple[int, Optional[int]]]:
         """
         여러 출발지에서 목적지까지의 ETA를 배치로 계산
@@ -127,15 +153,12 @@ class NaverDirectionClient:
         Args:
             origins: 출발지 위치 목록
             destination: 공통 목적지
-            max_concurrent: 최대 동시 요청 수 (기본 3개, Rate Limiting 고려)
         
         Returns:
             List[Tuple[int, Optional[int]]]: (인덱스, ETA분) 튜플 리스트
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
-        
         async def calculate_single_eta(index: int, origin: Tuple[float, float]) -> Tuple[int, Optional[int]]:
-            async with semaphore:
+            async with self._semaphore:
                 eta = await self.get_driving_time(origin, destination)
                 # API 호출 간격 조정 (Rate Limiting 준수)
                 await asyncio.sleep(0.2)
@@ -171,6 +194,7 @@ class ETACalculator:
         """
         self.use_mock_data = use_mock_data
         self.mock_data = {}
+        self._mock_index: Dict[Tuple[float, float, float, float], int] = {}  # 좌표 → ETA(분) 조회 테이블
         self.cache = {}  # 간단한 메모리 캐시
         
         if use_mock_data and mock_data_path:
@@ -179,16 +203,49 @@ class ETACalculator:
         if not use_mock_data:
             self.naver_client = NaverDirectionClient()
     
+    async def close(self):
+        """네이버 API 클라이언트의 공유 HTTP 세션 종료"""
+        if not self.use_mock_data:
+            await self.naver_client.close()
+    
     def _load_mock_data(self, mock_data_path: str):
         """목 데이터 로드"""
         try:
             with open(mock_data_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
                 self.mock_data = data.get('direction', {})
+            self._mock_index = self._build_mock_index(self.mock_data)
             logger.info(f"목 데이터 로드 완료: {len(self.mock_data)}개 경로")
         except Exception as e:
             logger.error(f"목 데이터 로드 실패: {str(e)}")
             self.mock_data = {}
+            self._mock_index = {}
+    
+    @staticmethod
+    def _mock_key(origin: Tuple[float, float], destination: Tuple[float, float]) -> Tuple[float, float, float, float]:
+        """목 데이터 조회 키 생성 (위도, 경도 순서, 소수점 4자리 반올림)"""
+        return (round(origin[0], 4), round(origin[1], 4), round(destination[0], 4), round(destination[1], 4))
+    
+    def _build_mock_index(self, direction_data: Dict[str, Any]) -> Dict[Tuple[float, float, float, float], int]:
+        """
+        "경도,위도_to_경도,위도" 키의 목 응답을 좌표 튜플 → ETA(분) 테이블로 변환
+        
+        로드 시점에 한 번만 응답을 해석하여 이후 조회는 dict 조회 한 번으로 끝납니다.
+        """
+        index = {}
+        for key, api_response in direction_data.items():
+            try:
+                start, goal = key.split('_to_')
+                start_lon, start_lat = (float(value) for value in start.split(','))
+                goal_lon, goal_lat = (float(value) for value in goal.split(','))
+            except ValueError:
+                logger.warning(f"목 데이터 키 형식 오류: {key}")
+                continue
+            
+            eta = NaverDirectionClient._extract_travel_time(api_response)
+            if eta is not None:
+                index[self._mock_key((start_lat, start_lon), (goal_lat, goal_lon))] = eta
+        return index
     
     def _generate_cache_key(self, origin: Tuple[float, float], destination: Tuple[float, float]) -> str:
         """캐시 키 생성"""
@@ -210,13 +267,17 @@ class ETACalculator:
         
         # 캐시 확인
         if cache_key in self.cache:
-            logger.debug(f"캐시에서 ETA 반환: {cache_key}")
+            logger.debug("캐시에서 ETA 반환: %s", cache_key)
             return self.cache[cache_key]
         
-        # 실제 네이버 API 호출
-        eta = await self.naver_client.get_driving_time(origin, destination)
-        if eta:
-            logger.debug(f"네이버 API에서 ETA 계산: {eta}분")
+        if self.use_mock_data:
+            # 목 데이터 조회 테이블에서 ETA 반환
+            eta = self._mock_index.get(self._mock_key(origin, destination))
+        else:
+            # 실제 네이버 API 호출
+            eta = await self.naver_client.get_driving_time(origin, destination)
+            if eta:
+                logger.debug("네이버 API에서 ETA 계산: %s분", eta)
         
         # Fallback: 거리 기반 계산
         if eta is None:
@@ -255,6 +316,10 @@ class ETACalculator:
         Returns:
             List[int]: 각 출발지의 ETA (분) 리스트
         """
+        if self.use_mock_data:
+            # 목 데이터는 조회 테이블에서 바로 반환 (없으면 거리 기반 Fallback)
+            return [await self.calculate_eta(origin, destination) for origin in origins]
+        
         # 네이버 API를 사용한 배치 계산
         batch_results = await self.naver_client.batch_calculate_eta(origins, destination)
         
@@ -265,4 +330,139 @@ class ETACalculator:
                 eta = await self.calculate_eta(origins[i], destination)
             processed_results.append(eta)
         
-        return processed_results
\ No newline at end of file
+        return processed_results
+
+
+class ETABatcher:
+    """
+    동시에 들어온 여러 매칭 요청의 ETA 계산을 짧은 시간 창 단위로 모아 처리하는 배처
+
+    요청마다 따로 batch_calculate_eta를 호출하는 대신, max_delay 동안 모인
+    (출발지, 목적지) 쌍을 목적지별로 묶고 중복 출발지를 제거한 뒤 한 번에 계산합니다.
+    """
+
+    def __init__(self, eta_calculator: "ETACalculator", max_batch: int = 50, max_delay: float = 0.01):
+        """
+        Args:
+            eta_calculator: 실제 ETA 계산을 수행할 ETACalculator
+            max_batch: 한 번에 처리할 최대 요청 수
+            max_delay: 배치를 모으기 위해 대기하는 최대 시간 (초)
+        """
+        self.eta_calculator = eta_calculator
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._dispatches = set()
+
+    def start(self):
+        """백그라운드 워커 시작 (실행 중인 이벤트 루프 안에서 호출)"""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """
+        백그라운드 워커 종료
+
+        큐에 남은 요청은 실패 처리하고, 진행 중인 배치 계산은 취소가 끝날 때까지 기다린 뒤 반환
+        (이후 종료 단계에서 닫히는 HTTP 세션을 사용하는 작업이 남지 않도록 함)
+        """
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+        while not self._queue.empty():
+            _, _, future = self._queue.get_nowait()
+            self._fail_pending([future])
+
+        dispatches = list(self._dispatches)
+        for task in dispatches:
+            task.cancel()
+        await asyncio.gather(*dispatches, return_exceptions=True)
+
+    @staticmethod
+    def _fail_pending(futures: List[asyncio.Future]):
+        """아직 결과가 없는 Future를 배처 종료 예외로 완료"""
+        for future in futures:
+            if not future.done():
+                future.set_exception(RuntimeError("ETA 배처가 종료되어 요청을 처리하지 못했습니다"))
+
+    def submit(self, origin: Tuple[float, float], destination: Tuple[float, float]) -> asyncio.Future:
+        """
+        ETA 계산 요청을 큐에 등록
+
+        Args:
+            origin: 출발지 (위도, 경도)
+            destination: 목적지 (위도, 경도)
+
+        Returns:
+            asyncio.Future: ETA (분)으로 완료되는 Future
+        """
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((origin, destination, future))
+        return future
+
+    async def _run(self):
+        """큐에서 요청을 모아 배치 단위로 처리"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_delay
+
+            try:
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # 수집 중 종료되면 이미 큐에서 꺼낸 요청도 실패 처리
+                self._fail_pending([future for _, _, future in batch])
+                raise
+
+            # 계산이 끝나기를 기다리지 않고 다음 배치 수집을 계속
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+            # 배치 계산이 취소되어 결과를 받지 못한 요청은 실패 처리
+            task.add_done_callback(lambda _, batch=batch: self._fail_pending([future for _, _, future in batch]))
+
+    async def _dispatch(self, batch: List[Tuple[Tuple[float, float], Tuple[float, float], asyncio.Future]]):
+        """목적지별로 중복 출발지를 제거하여 ETA를 계산하고 결과를 각 Future에 전달"""
+        waiters: Dict[Tuple[float, float], Dict[Tuple[float, float], List[asyncio.Future]]] = {}
+        for origin, destination, future in batch:
+            waiters.setdefault(destination, {}).setdefault(origin, []).append(future)
+
+        logger.debug("ETA 배치 처리: 요청 %d건, 목적지 %d곳", len(batch), len(waiters))
+
+        async def calculate_for_destination(destination, futures_by_origin):
+            origins = list(futures_by_origin)
+            try:
+                etas = await self.eta_calculator.batch_calculate_eta(origins, destination)
+            except Exception as e:
+                logger.error(f"배치 ETA 계산 중 오류: {str(e)}")
+                for futures in futures_by_origin.values():
+                    for future in futures:
+                        if not future.done():
+                            future.set_exception(e)
+                return
+
+            for origin, eta in zip(origins, etas):
+                for future in futures_by_origin[origin]:
+                    if not future.done():
+                        future.set_result(eta)
+
+        await asyncio.gather(*(
+            calculate_for_destination(destination, futures_by_origin)
+            for destination, futures_by_origin in waiters.items()
+        ))
@@ -4,12 +4,33 @@
 """
 
 import re
-from datetime import time
-from typing import Optional, Tuple, List
+from datetime import date, time
+from functools import lru_cache
+from typing import Optional, Tuple, List, Iterable, Union
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# 시간 문자열 패턴 (HH:MM, 뒤에 초가 붙어도 허용) - 모듈 로드 시 한 번만 컴파일
+TIME_PATTERN = re.compile(r'(\d{1,2}):(\d{2})')
+
+# 요일별 비트 위치 (bit 0 = 월요일 ... bit 6 = 일요일, datetime.weekday()와 동일)
+DAY_OF_WEEK_BITS = {
+    name: bit
+    for bit, names in enumerate([
+        ("MONDAY", "MON", "월요일", "월"),
+        ("TUESDAY", "TUE", "화요일", "화"),
+        ("WEDNESDAY", "WED", "수요일", "수"),
+        ("THURSDAY", "THU", "목요일", "목"),
+        ("FRIDAY", "FRI", "금요일", "금"),
+        ("SATURDAY", "SAT", "토요일", "토"),
+        ("SUNDAY", "SUN", "일요일", "일"),
+    ])
+    for name in names
+}
+
 def parse_time(time_str: str) -> Optional[time]:
     """
     시간 문자열(HH:MM 형식)을 datetime.time 객체로 파싱
@@ -25,8 +46,7 @@ def parse_time(time_str: str) -> Optional[time]:
         
     try:
         # 다양한 시간 형식 지원
-        time_pattern = r'(\d{1,2}):(\d{2})'
-        match = re.match(time_pattern, time_str.strip())
+        match = TIME_PATTERN.match(time_str.strip())
         
         if match:
             hour = int(match.group(1))
@@ -46,6 +66,46 @@ def parse_time(time_str: str) -> Optional[time]:
         logger.error(f"시간 파싱 중 오류: {time_str}, {e}")
         return None
 
+@lru_cache(maxsize=1024)
+def time_to_minutes(time_str: Optional[str]) -> Optional[int]:
+    """
+    시간 문자열(HH:MM 형식)을 자정 기준 분 단위 정수로 변환
+    (같은 시간 문자열이 요청/요양보호사마다 반복되므로 결과를 캐시)
+    
+    Args:
+        time_str: "HH:MM" 형식의 시간 문자열
+        
+    Returns:
+        int: 자정 기준 분 (0 ~ 1439) 또는 파싱 실패 시 None
+    """
+    parsed = parse_time(time_str)
+    if parsed is None:
+        return None
+    return parsed.hour * 60 + parsed.minute
+
+def days_to_mask(days: Union[str, Iterable[str], None]) -> int:
+    """
+    요일 목록을 7비트 마스크로 변환 (예: "MONDAY,WEDNESDAY" → 0b0000101)
+    
+    Args:
+        days: 요일 이름 목록 또는 쉼표로 구분된 요일 문자열
+            (DayOfWeek 값, 영문 약어, 한국어 요일 지원)
+        
+    Returns:
+        int: 요일 비트마스크, 알 수 없는 요일은 무시
+    """
+    if not days:
+        return 0
+    if isinstance(days, str):
+        days = days.split(',')
+        
+    mask = 0
+    for day in days:
+        bit = DAY_OF_WEEK_BITS.get(day.strip().upper())
+        if bit is not None:
+            mask |= 1 << bit
+    return mask
+
 def is_time_overlap(
     start_time1: Optional[str], 
     end_time1: Optional[str],
@@ -69,17 +129,32 @@ def is_time_overlap(
         logger.debug("필수 시간 정보가 부족하여 기본적으로 겹침 처리")
         return True
         
-    # 시간 문자열 파싱
-    start1 = parse_time(start_time1)
-    end1 = parse_time(end_time1)
-    start2 = parse_time(start_time2)
-    end2 = parse_time(end_time2)
+    # 시간 문자열을 분 단위 정수로 변환
+    start1 = time_to_minutes(start_time1)
+    end1 = time_to_minutes(end_time1)
+    start2 = time_to_minutes(start_time2)
+    end2 = time_to_minutes(end_time2)
     
     # 파싱 실패 시 기본적으로 겹친다고 판단
-    if not all([start1, end1, start2, end2]):
+    if None in (start1, end1, start2, end2):
         logger.warning("시간 파싱 실패로 기본적으로 겹침 처리")
         return True
     
+    return is_minutes_overlap(start1, end1, start2, end2)
+
+def is_minutes_overlap(start1: int, end1: int, start2: int, end2: int) -> bool:
+    """
+    분 단위 정수로 표현된 두 시간대가 겹치는지 확인
+    
+    Args:
+        start1: 첫 번째 시간대 시작 시간 (자정 기준 분)
+        end1: 첫 번째 시간대 종료 시간 (자정 기준 분)
+        start2: 두 번째 시간대 시작 시간 (자정 기준 분)
+        end2: 두 번째 시간대 종료 시간 (자정 기준 분)
+        
+    Returns:
+        bool: 시간대가 겹치면 True, 아니면 False
+    """
     # 시간대 겹침 확인 로직
     # 경우 1: 첫 번째 시간대가 두 번째 시간대와 완전히 겹치는 경우
     if start1 <= start2 and end1 >= end2:
@@ -107,6 +182,34 @@ def is_time_overlap(
         
     return False
 
+def minutes_overlap_mask(
+    preferred_start: int,
+    preferred_end: int,
+    starts: np.ndarray,
+    ends: np.ndarray
+) -> np.ndarray:
+    """
+    선호시간대 하나와 여러 근무시간대의 겹침 여부를 한 번에 계산 (is_minutes_overlap의 벡터화 버전)
+    
+    Args:
+        preferred_start: 선호 시작 시간 (자정 기준 분)
+        preferred_end: 선호 종료 시간 (자정 기준 분)
+        starts: 근무 시작 시간 배열 (자정 기준 분)
+        ends: 근무 종료 시간 배열 (자정 기준 분)
+        
+    Returns:
+        np.ndarray: 시간대가 겹치는 위치가 True인 bool 배열
+    """
+    s1, e1 = preferred_start, preferred_end
+    return (
+        ((s1 <= starts) & (e1 >= ends)) |
+        ((starts <= s1) & (ends >= e1)) |
+        ((s1 <= starts) & (starts < e1)) |
+        ((s1 < ends) & (ends <= e1)) |
+        ((starts <= s1) & (s1 < ends)) |
+        ((starts < e1) & (e1 <= ends))
+    )
+
 def filter_caregivers_by_time_preference(
     caregivers: List[dict],
     preferred_start_time: Optional[str],
@@ -126,6 +229,14 @@ def filter_caregivers_by_time_preference(
     if not preferred_start_time or not preferred_end_time:
         logger.info("신청자 선호시간대 정보가 없어 모든 요양보호사 통과")
         return caregivers
+    
+    # 신청자 선호시간대는 요청 단위로 고정이므로 루프 밖에서 한 번만 파싱
+    preferred_start = time_to_minutes(preferred_start_time)
+    preferred_end = time_to_minutes(preferred_end_time)
+    
+    if preferred_start is None or preferred_end is None:
+        logger.warning("신청자 선호시간대 파싱 실패로 모든 요양보호사 통과")
+        return caregivers
         
     filtered_caregivers = []
     
@@ -135,19 +246,20 @@ def filter_caregivers_by_time_preference(
         
         # 요양보호사 근무시간 정보가 없는 경우 기본적으로 통과
         if not caregiver_start_time or not caregiver_end_time:
-            logger.debug(f"요양보호사 {caregiver.get('caregiver_id', 'unknown')} 근무시간 정보 없음 - 통과")
+            logger.debug("요양보호사 %s 근무시간 정보 없음 - 통과", caregiver.get('caregiver_id', 'unknown'))
             filtered_caregivers.append(caregiver)
             continue
             
-        # 시간대 겹침 확인
-        if is_time_overlap(
-            preferred_start_time, preferred_end_time,
-            caregiver_start_time, caregiver_end_time
-        ):
+        caregiver_start = time_to_minutes(caregiver_start_time)
+        caregiver_end = time_to_minutes(caregiver_end_time)
+        
+        # 시간대 겹침 확인 (근무시간 파싱 실패 시 기본적으로 통과)
+        if (caregiver_start is None or caregiver_end is None or
+                is_minutes_overlap(preferred_start, preferred_end, caregiver_start, caregiver_end)):
             filtered_caregivers.append(caregiver)
-            logger.debug(f"요양보호사 {caregiver.get('caregiver_id', 'unknown')} 시간대 겹침 - 통과")
+            logger.debug("요양보호사 %s 시간대 겹침 - 통과", caregiver.get('caregiver_id', 'unknown'))
         else:
-            logger.debug(f"요양보호사 {caregiver.get('caregiver_id', 'unknown')} 시간대 불일치 - 제외")
+            logger.debug("요양보호사 %s 시간대 불일치 - 제외", caregiver.get('caregiver_id', 'unknown'))
             
     logger.info(f"시간대 필터링 완료: 전체 {len(caregivers)}명 중 {len(filtered_caregivers)}명 통과")
     return filtered_caregivers
@@ -163,10 +275,10 @@ def validate_time_range(start_time: str, end_time: str) -> bool:
     Returns:
         bool: 유효한 시간 범위이면 True, 아니면 False
     """
-    start = parse_time(start_time)
-    end = parse_time(end_time)
+    start = time_to_minutes(start_time)
+    end = time_to_minutes(end_time)
     
-    if not start or not end:
+    if start is None or end is None:
         return False
         
     return start < end
@@ -196,6 +308,46 @@ def test_time_utils():
         result = is_time_overlap(start1, end1, start2, end2)
         status = "✓" if result == expected else "✗"
         print(f"{status} {start1}-{end1} vs {start2}-{end2}: {result} (기대: {expected})")
+    
+    # 요일 비트마스크 테스트 (bit 0 = 월요일 ... bit 6 = 일요일)
+    day_mask_cases = [
+        # (입력, 기대 마스크)
+        (["MONDAY", "WEDNESDAY"], 0b0000101),  # DayOfWeek 값
+        (["월요일", "금", "SUN"], 0b1010001),   # 한국어/약어
+        ("monday, Friday", 0b0010001),         # 쉼표 구분 문자열 (대소문자/공백 무시)
+        (["HOLIDAY", "TUESDAY"], 0b0000010),   # 알 수 없는 요일은 무시
+        (None, 0),                             # 요일 정보 없음
+    ]
+    
+    for days, expected in day_mask_cases:
+        result = days_to_mask(days)
+        status = "✓" if result == expected else "✗"
+        print(f"{status} 요일 마스크 {days}: {result:07b} (기대: {expected:07b})")
+    
+    # 요청 날짜의 요일과 선호 요일 마스크 비교 (2025-09-01은 월요일, 2025-09-02는 화요일)
+    weekday_cases = [
+        (["MONDAY"], date(2025, 9, 1), True),   # 요일 일치
+        (["MONDAY"], date(2025, 9, 2), False),  # 요일 불일치
+    ]
+    
+    for days, request_date, expected in weekday_cases:
+        result = bool(days_to_mask(days) & (1 << request_date.weekday()))
+        status = "✓" if result == expected else "✗"
+        print(f"{status} 선호 요일 {days} vs {request_date}: {result} (기대: {expected})")
+    
+    # 벡터화한 겹침 마스크가 is_minutes_overlap과 같은 결과를 내는지 작은 격자에서 비교
+    grid = range(0, 8)
+    starts = np.array([s for s in grid for e in grid], dtype=np.int32)
+    ends = np.array([e for s in grid for e in grid], dtype=np.int32)
+    mismatches = []
+    for preferred_start in grid:
+        for preferred_end in grid:
+            mask = minutes_overlap_mask(preferred_start, preferred_end, starts, ends)
+            for start, end, result in zip(starts.tolist(), ends.tolist(), mask.tolist()):
+                if result != is_minutes_overlap(preferred_start, preferred_end, start, end):
+                    mismatches.append((preferred_start, preferred_end, start, end))
+    status = "✓" if not mismatches else "✗"
+    print(f"{status} minutes_overlap_mask vs is_minutes_overlap: {len(grid) ** 4}건 중 불일치 {len(mismatches)}건 {mismatches[:5]}")
 
 if __name__ == "__main__":
     test_time_utils()
\ No newline at end of file
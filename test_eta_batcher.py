@@ -0,0 +1,142 @@
+"""
+ETA 배처 동작 테스트 스크립트
+
+목 데이터 ETACalculator를 사용하여 ETABatcher의 요청 묶음 처리를 확인합니다.
+- 동시에 들어온 같은 (출발지, 목적지) 요청은 한 번만 계산되고 결과가 모든 요청에 전달되는지
+- 배치 계산이 실패하면 같은 배치의 모든 요청에 예외가 전달되는지
+- 취소된 요청이 있어도 나머지 요청에는 결과가 전달되는지
+- 배처 종료 시 처리 중인 요청이 실패 처리되고 배치 계산 작업이 남지 않는지
+"""
+
+import asyncio
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(__file__)))
+
+from app.utils.naver_direction import ETACalculator, ETABatcher
+
+DESTINATION = (37.566826, 126.978652)  # 서울시청
+ORIGIN = (37.3595122, 127.1052133)     # 네이버 그린팩토리
+OTHER_ORIGIN = (37.497942, 127.027621)  # 강남역
+
+
+class CountingETACalculator(ETACalculator):
+    """batch_calculate_eta 호출 인자를 기록하는 목 데이터 ETACalculator"""
+
+    def __init__(self):
+        super().__init__(use_mock_data=True)
+        self.calls = []
+
+    async def batch_calculate_eta(self, origins, destination):
+        self.calls.append((list(origins), destination))
+        return await super().batch_calculate_eta(origins, destination)
+
+
+class FailingETACalculator(ETACalculator):
+    """배치 계산이 항상 실패하는 목 데이터 ETACalculator"""
+
+    def __init__(self):
+        super().__init__(use_mock_data=True)
+
+    async def batch_calculate_eta(self, origins, destination):
+        raise RuntimeError("batch failed")
+
+
+class SlowETACalculator(ETACalculator):
+    """배치 계산이 끝나지 않는 목 데이터 ETACalculator (종료 처리 확인용)"""
+
+    def __init__(self):
+        super().__init__(use_mock_data=True)
+
+    async def batch_calculate_eta(self, origins, destination):
+        await asyncio.sleep(3600)
+
+
+async def test_concurrent_duplicate_requests():
+    """같은 목적지/출발지 동시 요청은 한 번만 계산되고 결과가 공유되는지 확인"""
+    calculator = CountingETACalculator()
+    batcher = ETABatcher(calculator)
+    try:
+        etas = await asyncio.gather(
+            batcher.submit(ORIGIN, DESTINATION),
+            batcher.submit(ORIGIN, DESTINATION),
+            batcher.submit(OTHER_ORIGIN, DESTINATION),
+        )
+    finally:
+        await batcher.stop()
+
+    expected = await calculator.calculate_eta(ORIGIN, DESTINATION)
+    assert etas[0] == etas[1] == expected, etas
+    assert etas[2] == await calculator.calculate_eta(OTHER_ORIGIN, DESTINATION), etas
+    # 한 배치, 한 목적지로 묶이고 중복 출발지는 한 번만 계산
+    assert len(calculator.calls) == 1, calculator.calls
+    origins, destination = calculator.calls[0]
+    assert destination == DESTINATION
+    assert sorted(origins) == sorted([ORIGIN, OTHER_ORIGIN]), origins
+    print(f"✅ 동시 중복 요청 묶음 처리: ETA {etas}, 계산 호출 {len(calculator.calls)}회")
+
+
+async def test_failing_batch():
+    """배치 계산 실패 시 같은 배치의 모든 요청에 예외가 전달되는지 확인"""
+    batcher = ETABatcher(FailingETACalculator())
+    try:
+        results = await asyncio.gather(
+            batcher.submit(ORIGIN, DESTINATION),
+            batcher.submit(OTHER_ORIGIN, DESTINATION),
+            return_exceptions=True,
+        )
+    finally:
+        await batcher.stop()
+
+    assert all(isinstance(result, RuntimeError) for result in results), results
+    print(f"✅ 배치 실패 전파: {[str(result) for result in results]}")
+
+
+async def test_cancelled_request():
+    """취소된 요청이 섞여 있어도 나머지 요청은 결과를 받는지 확인"""
+    calculator = CountingETACalculator()
+    batcher = ETABatcher(calculator)
+    try:
+        cancelled = batcher.submit(ORIGIN, DESTINATION)
+        remaining = batcher.submit(ORIGIN, DESTINATION)
+        cancelled.cancel()
+        eta = await remaining
+    finally:
+        await batcher.stop()
+
+    assert cancelled.cancelled()
+    assert eta == await calculator.calculate_eta(ORIGIN, DESTINATION), eta
+    print(f"✅ 취소된 요청 건너뜀: 남은 요청 ETA {eta}분")
+
+
+async def test_stop_with_pending_requests():
+    """배처 종료 시 계산 중인 요청은 예외로 완료되고 배치 작업이 정리되는지 확인"""
+    batcher = ETABatcher(SlowETACalculator())
+    future = batcher.submit(ORIGIN, DESTINATION)
+    # 배치 수집이 끝나고 계산이 시작될 때까지 대기
+    await asyncio.sleep(batcher.max_delay * 5)
+    await batcher.stop()
+
+    assert isinstance(future.exception(), RuntimeError), future
+    assert not batcher._dispatches, batcher._dispatches
+    print(f"✅ 종료 시 대기 요청 실패 처리: {future.exception()}")
+
+
+async def main():
+    """메인 테스트 함수"""
+    print("🚀 ETA 배처 테스트 시작")
+    print("=" * 50)
+
+    await test_concurrent_duplicate_requests()
+    await test_failing_batch()
+    await test_cancelled_request()
+    await test_stop_with_pending_requests()
+
+    print("=" * 50)
+    print("🎉 ETA 배처 테스트 완료")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())